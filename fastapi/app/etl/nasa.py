@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
-import json
+import email.utils
 import os
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import httpx
+import numpy as np
+import pandas as pd
 import psycopg2
-import psycopg2.extras
-import requests
 from dotenv import load_dotenv
 
+from app.etl.pgcopy import copy_upsert, refresh_weather_summary
+
 # ---- Config helpers ---------------------------------------------------------
 
 
@@ -29,50 +33,60 @@ def env(name: str, default: Optional[str] = None) -> str:
 POWER_BASE = "https://power.larc.nasa.gov/api/temporal/hourly/point"
 PARAMS = ["ALLSKY_SFC_SW_DWN", "T2M", "WS10M"]  # GHI, temperature, wind speed
 
+# NASA POWER rate-limits aggressively, so cap how many chunks are in flight at once
+MAX_CONCURRENT_CHUNKS = 8
+
+# Throttling and transient upstream errors are retried with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+# Upper bound on a server-supplied Retry-After so one response cannot stall the run
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+# Static part of the query string, built once; only the point and window vary per chunk
+_BASE_QS = f"parameters={','.join(PARAMS)}&community=RE&format=JSON&time-standard=UTC"
+
 
 # Compose the NASA POWER endpoint with consistent query parameters
 def build_power_url(lat: float, lon: float, start_yyyymmdd: str, end_yyyymmdd: str) -> str:
-    query = {
-        "parameters": ",".join(PARAMS),
-        "community": "RE",
-        "longitude": lon,
-        "latitude": lat,
-        "start": start_yyyymmdd,
-        "end": end_yyyymmdd,
-        "format": "JSON",
-        "time-standard": "UTC",
-    }
-    query_string = "&".join(f"{key}={query[key]}" for key in query)
-    return f"{POWER_BASE}?{query_string}"
-
-
-# Execute the HTTP request and raise if NASA responds with an error
-def fetch_power(lat: float, lon: float, start_yyyymmdd: str, end_yyyymmdd: str) -> dict:
-    url = build_power_url(lat, lon, start_yyyymmdd, end_yyyymmdd)
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
-    return response.json()
+    return f"{POWER_BASE}?{_BASE_QS}&longitude={lon}&latitude={lat}&start={start_yyyymmdd}&end={end_yyyymmdd}"
 
 
 # Normalise NASA parameter structures into a timestamp-keyed dictionary
 def _series_from_param(param_dict: Dict) -> Dict[dt.datetime, Optional[float]]:
     """Normalise multiple parameter formats into a timestamp->value mapping."""
 
+    # Keys are fixed-width YYYYMMDD[HH], so slice the digits instead of paying for strptime
+    utc = dt.timezone.utc
     series: Dict[dt.datetime, Optional[float]] = {}
-    for key, value in param_dict.items():
-        if isinstance(value, list):
-            date = dt.datetime.strptime(str(key), "%Y%m%d").date()
+
+    # POWER returns one shape per request, so check the first value and specialise the loop
+    try:
+        first_value = next(iter(param_dict.values()))
+    except StopIteration:
+        return series
+
+    if isinstance(first_value, list):
+        for key, value in param_dict.items():
+            s = str(key)
+            base = dt.datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]), tzinfo=utc)
             for hour, hourly_value in enumerate(value):
-                ts = dt.datetime(date.year, date.month, date.day, hour, tzinfo=dt.timezone.utc)
+                ts = base + dt.timedelta(hours=hour)
                 series[ts] = None if hourly_value is None else float(hourly_value)
-        else:
+    else:
+        for key, value in param_dict.items():
             key_str = str(key)
-            if len(key_str) >= 10:
-                try:
-                    ts = dt.datetime.strptime(key_str[:10], "%Y%m%d%H").replace(tzinfo=dt.timezone.utc)
-                except ValueError:
-                    continue
-                series[ts] = None if value is None else float(value)
+            # Reject non-numeric keys up front rather than via a raised ValueError per bad key
+            if len(key_str) < 10 or not key_str[:10].isdigit():
+                continue
+            try:
+                ts = dt.datetime(
+                    int(key_str[0:4]), int(key_str[4:6]), int(key_str[6:8]), int(key_str[8:10]), tzinfo=utc
+                )
+            except ValueError:
+                continue  # all digits but not a real date/hour (e.g. hour 24)
+            series[ts] = None if value is None else float(value)
     return series
 
 
@@ -87,11 +101,24 @@ def parse_power_json(payload: dict) -> Dict[str, Dict[dt.datetime, Optional[floa
     return parsed
 
 
+# Bronze row tuple: (site, ts_utc, ghi_wm2, t2m_c, ws10_mps, raw_json serialised as a JSON string)
+RawRow = Tuple[str, dt.datetime, Optional[float], Optional[float], Optional[float], str]
+
+
+def _j(value: Optional[float]) -> str:
+    return "null" if value is None else repr(value)
+
+
+# raw has a fixed schema, so build the JSON text directly instead of json.dumps per row
+def _raw_json(ghi: Optional[float], t2m: Optional[float], ws: Optional[float]) -> str:
+    return f'{{"source":"NASA_POWER","ghi_wm2":{_j(ghi)},"t2m_c":{_j(t2m)},"ws10_mps":{_j(ws)}}}'
+
+
 # Align all parameters on the same timestamp so we can bulk insert rows
 def merge_params_to_rows(
     site: str,
     series_map: Dict[str, Dict[dt.datetime, Optional[float]]],
-) -> List[Tuple[str, dt.datetime, Optional[float], Optional[float], Optional[float], Dict[str, Optional[float]]]]:
+) -> List[RawRow]:
     """Align timestamps across parameters and construct DB row tuples."""
 
     timestamps: set[dt.datetime] = set()
@@ -103,49 +130,77 @@ def merge_params_to_rows(
         ghi = series_map["ALLSKY_SFC_SW_DWN"].get(ts)
         t2m = series_map["T2M"].get(ts)
         ws = series_map["WS10M"].get(ts)
-        raw = {"source": "NASA_POWER", "ghi_wm2": ghi, "t2m_c": t2m, "ws10_mps": ws}
-        rows.append((site, ts, ghi, t2m, ws, raw))
+        rows.append((site, ts, ghi, t2m, ws, _raw_json(ghi, t2m, ws)))
     return rows
 
 
+# Flatten the usual date -> [24 hourly values] layout into one contiguous hourly array
+def _series_as_array(param_dict: Dict) -> Optional[Tuple[dt.datetime, np.ndarray]]:
+    """Return (first hour, values) for a gap-free list-valued series, else None."""
+
+    if not param_dict or not all(isinstance(value, list) for value in param_dict.values()):
+        return None
+
+    dates = sorted(str(key) for key in param_dict)
+    first = dt.datetime(int(dates[0][0:4]), int(dates[0][4:6]), int(dates[0][6:8]), tzinfo=dt.timezone.utc)
+    last = dt.datetime(int(dates[-1][0:4]), int(dates[-1][4:6]), int(dates[-1][6:8]), tzinfo=dt.timezone.utc)
+    if (last - first).days != len(dates) - 1 or any(len(param_dict[d]) != 24 for d in dates):
+        return None  # gaps or partial days: let the dict path align timestamps
+
+    values = np.concatenate([np.asarray(param_dict[d], dtype=np.float64) for d in dates])
+    return first, values
+
+
+def _nullable(values: np.ndarray) -> list:
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+# Build Bronze rows straight from a POWER payload, vectorised when the series share one hourly grid
+def payload_to_rows(site: str, payload: dict) -> List[RawRow]:
+    params = payload.get("properties", {}).get("parameter", {})
+    grids = [_series_as_array(params.get(parameter, {})) for parameter in PARAMS]
+
+    if any(grid is None for grid in grids) or len({(start, len(values)) for start, values in grids}) != 1:
+        return merge_params_to_rows(site, parse_power_json(payload))
+
+    start, ghi_arr = grids[0]
+    ts_index = pd.date_range(start, periods=len(ghi_arr), freq="h", tz="UTC").to_pydatetime()
+    ghi_vals, t2m_vals, ws_vals = (_nullable(values) for _, values in grids)
+    return [
+        (site, ts, ghi, t2m, ws, _raw_json(ghi, t2m, ws))
+        for ts, ghi, t2m, ws in zip(ts_index, ghi_vals, t2m_vals, ws_vals)
+    ]
+
+
 # ---- DB write ----------------------------------------------------------------
 
 
+RAW_WEATHER_COLUMNS = ("site", "ts_utc", "ghi_wm2", "t2m_c", "ws10_mps", "raw_json")
+
+
 # Lazily create a new psycopg2 connection using DATABASE_URL
 def get_conn():
     dsn = env("DATABASE_URL")
     return psycopg2.connect(dsn)
 
 
-def _jsonify_rows(rows: Iterable[Tuple[str, dt.datetime, Optional[float], Optional[float], Optional[float], Dict[str, Optional[float]]]]):
-    for site, ts, ghi, t2m, ws, raw in rows:
-        yield (site, ts, ghi, t2m, ws, psycopg2.extras.Json(raw))
-
-
-# Use execute_values for efficiency and UPSERT to keep reruns idempotent
-def bulk_upsert_raw_weather(rows: List[Tuple[str, dt.datetime, Optional[float], Optional[float], Optional[float], Dict[str, Optional[float]]]]):
+# COPY into a temp stage table, then UPSERT from it to keep reruns idempotent
+def bulk_upsert_raw_weather(rows: List[RawRow]):
     if not rows:
         return 0
 
-    sql = """
-    INSERT INTO raw_weather (site, ts_utc, ghi_wm2, t2m_c, ws10_mps, raw_json)
-    VALUES %s
-    ON CONFLICT (site, ts_utc) DO UPDATE
-    SET ghi_wm2 = EXCLUDED.ghi_wm2,
-        t2m_c   = EXCLUDED.t2m_c,
-        ws10_mps= EXCLUDED.ws10_mps,
-        raw_json = EXCLUDED.raw_json;
-    """
-
     with get_conn() as conn:
         with conn.cursor() as cursor:
-            psycopg2.extras.execute_values(
+            copy_upsert(
                 cursor,
-                sql,
-                _jsonify_rows(rows),
-                template="(%s,%s,%s,%s,%s,%s)",
-                page_size=1000,
+                "raw_weather",
+                RAW_WEATHER_COLUMNS,
+                rows,
+                conflict_columns=("site", "ts_utc"),
             )
+            refresh_weather_summary(cursor, "raw_weather", (row[0] for row in rows))
     return len(rows)
 
 
@@ -156,6 +211,69 @@ def yyyymmdd_to_date(value: str) -> dt.date:
     return dt.datetime.strptime(value, "%Y%m%d").date()
 
 
+# Split the requested date range into inclusive [start, end] windows of chunk_days
+def build_windows(start_date: dt.date, end_date: dt.date, chunk_days: int) -> List[Tuple[str, str]]:
+    windows: List[Tuple[str, str]] = []
+    cursor = start_date
+    while cursor <= end_date:
+        chunk_end = min(cursor + dt.timedelta(days=chunk_days - 1), end_date)
+        windows.append((cursor.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")))
+        cursor = chunk_end + dt.timedelta(days=1)
+    return windows
+
+
+# Seconds to wait before the next attempt: Retry-After (seconds or HTTP date) when sent, else backoff
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            delay = (when - dt.datetime.now(dt.timezone.utc)).total_seconds()
+            return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS)
+    return BACKOFF_FACTOR * 2**attempt
+
+
+# Fetch, parse, and align a single window; the semaphore bounds concurrent NASA calls
+async def _fetch_chunk(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    lat: float,
+    lon: float,
+    site: str,
+    start_yyyymmdd: str,
+    end_yyyymmdd: str,
+):
+    url = build_power_url(lat, lon, start_yyyymmdd, end_yyyymmdd)
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore:
+            response = await client.get(url)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        # Sleep outside the semaphore so other windows keep using the slot
+        await asyncio.sleep(_retry_delay(response, attempt))
+    response.raise_for_status()
+    return payload_to_rows(site, response.json())
+
+
+# Dispatch every window concurrently over one pooled keep-alive client. A failed window is
+# returned as its exception so the windows that did succeed can still be written.
+async def _fetch_windows(lat: float, lon: float, site: str, windows: List[Tuple[str, str]]):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_CHUNKS, max_keepalive_connections=MAX_CONCURRENT_CHUNKS)
+    # Transport retries cover connection errors; HTTP status retries happen in _fetch_chunk
+    transport = httpx.AsyncHTTPTransport(retries=3, limits=limits)
+    async with httpx.AsyncClient(transport=transport, timeout=60) as client:
+        return await asyncio.gather(
+            *(_fetch_chunk(client, semaphore, lat, lon, site, start, end) for start, end in windows),
+            return_exceptions=True,
+        )
+
+
 # Fetch data in manageable windows, clean it, then write to the Bronze table
 def run_ingest(lat: float, lon: float, site: str, start: str, end: str, chunk_days: int = 7):
     start_date = yyyymmdd_to_date(start)
@@ -164,17 +282,20 @@ def run_ingest(lat: float, lon: float, site: str, start: str, end: str, chunk_da
     if end_date < start_date:
         raise ValueError("end date must be on or after start date")
 
-    total_inserted = 0
-    cursor = start_date
-    while cursor <= end_date:
-        chunk_end = min(cursor + dt.timedelta(days=chunk_days - 1), end_date)
-        payload = fetch_power(lat, lon, cursor.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d"))
-        series_map = parse_power_json(payload)
-        rows = merge_params_to_rows(site, series_map)
-        total_inserted += bulk_upsert_raw_weather(rows)
-        cursor = chunk_end + dt.timedelta(days=1)
+    windows = build_windows(start_date, end_date, chunk_days)
+    results = asyncio.run(_fetch_windows(lat, lon, site, windows))
+    errors = [(window, result) for window, result in zip(windows, results) if isinstance(result, BaseException)]
+
+    # Windows never overlap, so a single combined upsert cannot hit the same key twice.
+    # Successful windows are written even when others failed, so a rerun only has to redo those.
+    rows = [row for result in results if not isinstance(result, BaseException) for row in result]
+    total_inserted = bulk_upsert_raw_weather(rows)
 
     print(f"[nasa] inserted/updated rows: {total_inserted}")
+    if errors:
+        for (start_yyyymmdd, end_yyyymmdd), error in errors:
+            print(f"[nasa] window {start_yyyymmdd}-{end_yyyymmdd} failed: {error}")
+        raise errors[0][1]
 
 
 def main():
@@ -0,0 +1,78 @@
+"""PostgreSQL write helpers (COPY upsert, summary refresh) shared by the Bronze and Silver writers."""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+from typing import Any, Iterable, Sequence
+
+import psycopg2.extensions
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+# Render a single value in COPY text format (tab separated, \N for NULL)
+def _format_value_for_copy(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, float):
+        return repr(float(value))
+    if isinstance(value, dt.datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy_buffer(rows: Iterable[Sequence[Any]]) -> io.StringIO:
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_format_value_for_copy(value) for value in row))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
+
+# Stream rows into a temp stage table with COPY, then upsert them in one statement.
+# The stage table is dropped on commit, so call this at most once per transaction.
+def copy_upsert(
+    cursor: psycopg2.extensions.cursor,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    conflict_columns: Sequence[str],
+) -> int:
+    stage = f"_stage_{table}"
+    column_list = ", ".join(columns)
+    updates = ",\n        ".join(
+        f"{column} = EXCLUDED.{column}" for column in columns if column not in conflict_columns
+    )
+
+    cursor.execute(f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+    cursor.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN", _copy_buffer(rows))
+    cursor.execute(
+        f"""
+    INSERT INTO {table} ({column_list})
+    SELECT {column_list} FROM {stage}
+    ON CONFLICT ({", ".join(conflict_columns)}) DO UPDATE
+    SET {updates};
+    """
+    )
+    return cursor.rowcount
+
+
+# Recompute the weather_summary rows for the sites just written, in the caller's transaction
+def refresh_weather_summary(cursor: psycopg2.extensions.cursor, table: str, sites: Iterable[str]) -> None:
+    cursor.execute(
+        f"""
+    INSERT INTO weather_summary (table_name, site, row_count, first_ts, latest_ts)
+    SELECT %s, site, COUNT(*), MIN(ts_utc), MAX(ts_utc)
+    FROM {table}
+    WHERE site = ANY(%s)
+    GROUP BY site
+    ON CONFLICT (table_name, site) DO UPDATE
+    SET row_count = EXCLUDED.row_count,
+        first_ts  = EXCLUDED.first_ts,
+        latest_ts = EXCLUDED.latest_ts,
+        refreshed_at = NOW();
+    """,
+        (table, sorted(set(sites))),
+    )
@@ -4,23 +4,41 @@ from __future__ import annotations
 
 import datetime as dt
 import os
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Generator, Optional
+from typing import Any, AsyncGenerator, Optional
 
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 import httpx
-import psycopg2
-import psycopg2.extras
-from psycopg2.pool import SimpleConnectionPool
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
 API_TIMEOUT_SECONDS = 10
 DEFAULT_DB_MIN_CONN = 1
 DEFAULT_DB_MAX_CONN = 5
-
-
-def _isoformat(value: Optional[dt.datetime]) -> Optional[str]:
-    return value.isoformat() if isinstance(value, dt.datetime) else None
+# Server-side prepare each statement after it has run this many times on a connection
+DB_PREPARE_THRESHOLD = 5
+SITES_CACHE_TTL_SECONDS = 60.0
+HOURLY_COLUMNS = ("site", "ts_utc", "ghi_wm2", "temp_c", "wind_mps")
+RAW_COLUMNS = ("site", "ts_utc", "ghi_wm2", "t2m_c", "ws10_mps", "ingested_at")
+
+# Latest N rows for a site, returned oldest -> newest by the outer ORDER BY
+RECENT_ROWS_SQL = """
+    SELECT *
+    FROM (
+        SELECT {columns}
+        FROM {table}
+        WHERE site = %s
+        ORDER BY ts_utc DESC
+        LIMIT %s
+    ) recent
+    ORDER BY ts_utc ASC
+"""
+HOURLY_ROWS_SQL = RECENT_ROWS_SQL.format(columns=", ".join(HOURLY_COLUMNS), table="fact_weather")
+RAW_ROWS_SQL = RECENT_ROWS_SQL.format(columns=", ".join(RAW_COLUMNS), table="raw_weather")
 
 
 def _parse_hours_to_start_end(hours: int) -> dt.timedelta:
@@ -30,7 +48,7 @@ def _parse_hours_to_start_end(hours: int) -> dt.timedelta:
 # FastAPI lifespan initialises connection pool and default site once per process
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialise shared resources (environment, database pool)."""
+    """Initialise shared resources (environment, database pool, HTTP client)."""
 
     load_dotenv()
     database_url = os.getenv("DATABASE_URL")
@@ -40,155 +58,175 @@ async def lifespan(app: FastAPI):
     min_conn = int(os.getenv("DB_MIN_CONNECTIONS", DEFAULT_DB_MIN_CONN))
     max_conn = max(min_conn, int(os.getenv("DB_MAX_CONNECTIONS", DEFAULT_DB_MAX_CONN)))
 
-    pool = SimpleConnectionPool(min_conn, max_conn, dsn=database_url)
+    # Async pool: each request's DB I/O runs on the event loop instead of hopping to a worker thread
+    pool = AsyncConnectionPool(
+        database_url,
+        min_size=min_conn,
+        max_size=max_conn,
+        kwargs={"prepare_threshold": DB_PREPARE_THRESHOLD},
+        open=False,
+    )
+    await pool.open()
 
     # Verify the connection eagerly so we fail fast on startup issues.
-    test_conn = pool.getconn()
-    try:
-        with test_conn.cursor() as cur:
-            cur.execute("SELECT 1")
-    finally:
-        pool.putconn(test_conn)
+    async with pool.connection() as test_conn:
+        await test_conn.execute("SELECT 1")
 
     app.state.db_pool = pool
     app.state.default_site = os.getenv("SITE_NAME", "chicago_il")
+    app.state._sites_cache = (0.0, [])
+    # One keep-alive client for upstream HTTP calls instead of a new connection per request
+    app.state.http = httpx.AsyncClient(
+        timeout=API_TIMEOUT_SECONDS, limits=httpx.Limits(max_keepalive_connections=4)
+    )
 
     try:
         yield
     finally:
-        pool.closeall()
+        await app.state.http.aclose()
+        await pool.close()
 
 
-def get_db_conn(request: Request) -> Generator[psycopg2.extensions.connection, None, None]:
+async def get_db_conn(request: Request) -> AsyncGenerator[psycopg.AsyncConnection, None]:
     """Provide a database connection from the pool for each request."""
 
-    pool: SimpleConnectionPool = request.app.state.db_pool
-    conn = pool.getconn()
-    try:
+    pool: AsyncConnectionPool = request.app.state.db_pool
+    async with pool.connection() as conn:
         yield conn
-    finally:
-        pool.putconn(conn)
 
 
 # Helper query to list available ingestion sites for dropdowns
-def fetch_sites(conn: psycopg2.extensions.connection) -> list[str]:
-    with conn.cursor() as cur:
-        cur.execute("SELECT DISTINCT site FROM raw_weather ORDER BY site ASC")
-        return [row[0] for row in cur.fetchall()]
+async def fetch_sites(conn: psycopg.AsyncConnection) -> list[str]:
+    async with conn.cursor() as cur:
+        await cur.execute("SELECT DISTINCT site FROM raw_weather ORDER BY site ASC")
+        return [row[0] for row in await cur.fetchall()]
+
+
+# Sites only change when a new one is ingested, so serve them from a short-lived cache
+async def _get_sites_cached(request: Request, conn: psycopg.AsyncConnection) -> list[str]:
+    now = time.monotonic()
+    cached_at, sites = request.app.state._sites_cache
+    if cached_at and now - cached_at < SITES_CACHE_TTL_SECONDS:
+        return sites
+    sites = await fetch_sites(conn)
+    request.app.state._sites_cache = (now, sites)
+    return sites
+
+
+# weather_summary is kept current by the Bronze/Silver writers, so this is a primary-key lookup
+# per (table, site); without a site the per-site rows are rolled up across all sites.
+SUMMARY_SQL = """
+    SELECT table_name AS k,
+           SUM(row_count) AS row_count,
+           MIN(first_ts) AS first_ts,
+           MAX(latest_ts) AS latest_ts
+    FROM weather_summary
+    WHERE table_name = ANY(%s){site_filter}
+    GROUP BY table_name
+"""
+
+
+def _summary_from_row(row: Any) -> dict[str, Any]:
+    row_count = int(row["row_count"]) if row and row["row_count"] is not None else 0
+    return {
+        "row_count": row_count,
+        "first_ts": row["first_ts"] if row_count else None,
+        "latest_ts": row["latest_ts"] if row_count else None,
+    }
+
+
+async def _fetch_summaries(
+    conn: psycopg.AsyncConnection, site: Optional[str], tables: tuple[str, ...]
+) -> dict[str, dict[str, Any]]:
+    sql = SUMMARY_SQL.format(site_filter=" AND site = %s" if site else "")
+    params: tuple[Any, ...] = (list(tables), site) if site else (list(tables),)
+
+    async with conn.cursor(row_factory=dict_row) as cur:
+        await cur.execute(sql, params)
+        rows = {row["k"]: row for row in await cur.fetchall()}
+
+    return {table: _summary_from_row(rows.get(table)) for table in tables}
 
 
 # Summary aggregation reused across endpoints to avoid duplication
-def fetch_weather_summary(
-    conn: psycopg2.extensions.connection, site: Optional[str], *, table: str = "fact_weather"
+async def fetch_weather_summary(
+    conn: psycopg.AsyncConnection, site: Optional[str], *, table: str = "fact_weather"
 ) -> dict[str, Any]:
-    sql = """
-        SELECT COUNT(*) AS row_count,
-               MIN(ts_utc) AS first_ts,
-               MAX(ts_utc) AS latest_ts
-        FROM {table}
-    """.format(table=table)
-    params: tuple[Any, ...] = ()
-    if site:
-        sql += " WHERE site = %s"
-        params = (site,)
+    return (await _fetch_summaries(conn, site, (table,)))[table]
 
-    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-        cur.execute(sql, params)
-        row = cur.fetchone()
 
-    row_count = int(row["row_count"]) if row and row["row_count"] is not None else 0
-    return {
-        "row_count": row_count,
-        "first_ts": _isoformat(row["first_ts"]) if row_count else None,
-        "latest_ts": _isoformat(row["latest_ts"]) if row_count else None,
-    }
+# Raw and fact summaries in one round-trip
+async def fetch_raw_and_fact_summaries(
+    conn: psycopg.AsyncConnection, site: Optional[str]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    summaries = await _fetch_summaries(conn, site, ("raw_weather", "fact_weather"))
+    return summaries["raw_weather"], summaries["fact_weather"]
 
 
 # Pull recent hourly silver rows for charts
-def fetch_hourly_rows(
-    conn: psycopg2.extensions.connection, site: str, hours: int
+async def fetch_hourly_rows(
+    conn: psycopg.AsyncConnection, site: str, hours: int
 ) -> list[dict[str, Any]]:
-    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-        cur.execute(
-            """
-            SELECT site, ts_utc, ghi_wm2, temp_c, wind_mps
-            FROM fact_weather
-            WHERE site = %s
-            ORDER BY ts_utc DESC
-            LIMIT %s
-            """,
-            (site, hours),
-        )
-        rows = cur.fetchall()
-
-    rows.reverse()  # Present data chronologically (oldest -> newest)
-    return [
-        {
-            "site": row["site"],
-            "ts_utc": _isoformat(row["ts_utc"]),
-            "ghi_wm2": row["ghi_wm2"],
-            "temp_c": row["temp_c"],
-            "wind_mps": row["wind_mps"],
-        }
-        for row in rows
-    ]
+    async with conn.cursor() as cur:
+        await cur.execute(HOURLY_ROWS_SQL, (site, hours))
+        rows = await cur.fetchall()
+
+    # Timestamps stay as datetimes; orjson serialises them natively as ISO 8601
+    return [dict(zip(HOURLY_COLUMNS, row)) for row in rows]
 
 
 # Pull raw bronze rows so the UI can show before/after comparisons
-def fetch_raw_rows(
-    conn: psycopg2.extensions.connection, site: str, hours: int
+async def fetch_raw_rows(
+    conn: psycopg.AsyncConnection, site: str, hours: int
 ) -> list[dict[str, Any]]:
-    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-        cur.execute(
-            """
-            SELECT site, ts_utc, ghi_wm2, t2m_c, ws10_mps, ingested_at
-            FROM raw_weather
-            WHERE site = %s
-            ORDER BY ts_utc DESC
-            LIMIT %s
-            """,
-            (site, hours),
-        )
-        rows = cur.fetchall()
-
-    rows.reverse()
-    return [
-        {
-            "site": row["site"],
-            "ts_utc": _isoformat(row["ts_utc"]),
-            "ghi_wm2": row["ghi_wm2"],
-            "t2m_c": row["t2m_c"],
-            "ws10_mps": row["ws10_mps"],
-            "ingested_at": _isoformat(row["ingested_at"]),
-        }
-        for row in rows
-    ]
+    async with conn.cursor() as cur:
+        await cur.execute(RAW_ROWS_SQL, (site, hours))
+        rows = await cur.fetchall()
+
+    return [dict(zip(RAW_COLUMNS, row)) for row in rows]
+
+
+# Raw vs silver KPI block shared by /weather/metrics and /weather/bundle
+def _metrics_payload(site: str, raw_summary: dict[str, Any], fact_summary: dict[str, Any]) -> dict[str, Any]:
+    raw_rows = raw_summary["row_count"]
+    fact_rows = fact_summary["row_count"]
+    kept_pct = (fact_rows / raw_rows * 100.0) if raw_rows else None
+    dropped_rows = raw_rows - fact_rows if raw_rows else 0
+
+    return {
+        "site": site,
+        "raw": raw_summary,
+        "fact": fact_summary,
+        "dropped_rows": max(dropped_rows, 0),
+        "kept_percentage": kept_pct,
+    }
 
 
-app = FastAPI(title="Climate API", version="0.3.0", lifespan=lifespan)
+app = FastAPI(title="Climate API", version="0.3.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.get("/")
-def root(
+async def root(
     request: Request,
-    conn: psycopg2.extensions.connection = Depends(get_db_conn),
+    conn: psycopg.AsyncConnection = Depends(get_db_conn),
     site: Optional[str] = None,
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Return API greeting plus quick summaries of warehouse contents."""
 
     target_site = site or request.app.state.default_site
-    sites = fetch_sites(conn)
-    fact_summary = fetch_weather_summary(conn, target_site)
-    raw_summary = fetch_weather_summary(conn, target_site, table="raw_weather")
+    sites = await _get_sites_cached(request, conn)
+    raw_summary, fact_summary = await fetch_raw_and_fact_summaries(conn, target_site)
 
-    return {
-        "status": "ok",
-        "message": "Welcome to the Climate API",
-        "site": target_site,
-        "sites": sites,
-        "summary": fact_summary,
-        "raw_summary": raw_summary,
-    }
+    return ORJSONResponse(
+        {
+            "status": "ok",
+            "message": "Welcome to the Climate API",
+            "site": target_site,
+            "sites": sites,
+            "summary": fact_summary,
+            "raw_summary": raw_summary,
+        }
+    )
 
 
 @app.get("/health")
@@ -199,104 +237,126 @@ def healthcheck() -> dict[str, str]:
 
 
 @app.get("/weather/sites")
-def list_sites(
-    conn: psycopg2.extensions.connection = Depends(get_db_conn),
+async def list_sites(
+    request: Request,
+    conn: psycopg.AsyncConnection = Depends(get_db_conn),
 ) -> dict[str, list[str]]:
     """Return the list of sites that currently have raw weather data."""
 
-    return {"sites": fetch_sites(conn)}
+    return {"sites": await _get_sites_cached(request, conn)}
 
 
 @app.get("/weather/hourly")
-def weather_hourly(
+async def weather_hourly(
     request: Request,
-    conn: psycopg2.extensions.connection = Depends(get_db_conn),
+    conn: psycopg.AsyncConnection = Depends(get_db_conn),
     site: Optional[str] = Query(None, description="Site identifier (defaults to SITE_NAME)"),
     hours: int = Query(24, ge=1, le=336, description="Number of hours to return"),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Return the most recent hourly fact_weather rows for the requested site."""
 
     target_site = site or request.app.state.default_site
-    sites = fetch_sites(conn)
+    sites = await _get_sites_cached(request, conn)
     if sites and target_site not in sites:
         raise HTTPException(status_code=404, detail=f"Unknown site '{target_site}'")
 
-    rows = fetch_hourly_rows(conn, target_site, hours)
-    summary = fetch_weather_summary(conn, target_site)
+    rows = await fetch_hourly_rows(conn, target_site, hours)
+    summary = await fetch_weather_summary(conn, target_site)
 
-    return {
-        "site": target_site,
-        "hours": hours,
-        "rows": rows,
-        "summary": summary,
-    }
+    return ORJSONResponse(
+        {
+            "site": target_site,
+            "hours": hours,
+            "rows": rows,
+            "summary": summary,
+        }
+    )
 
 
 @app.get("/weather/raw")
-def weather_raw(
+async def weather_raw(
     request: Request,
-    conn: psycopg2.extensions.connection = Depends(get_db_conn),
+    conn: psycopg.AsyncConnection = Depends(get_db_conn),
     site: Optional[str] = Query(None, description="Site identifier (defaults to SITE_NAME)"),
     hours: int = Query(24, ge=1, le=336, description="Number of hours to return"),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Return the most recent raw_weather rows for the requested site."""
 
     target_site = site or request.app.state.default_site
-    sites = fetch_sites(conn)
+    sites = await _get_sites_cached(request, conn)
     if sites and target_site not in sites:
         raise HTTPException(status_code=404, detail=f"Unknown site '{target_site}'")
 
-    rows = fetch_raw_rows(conn, target_site, hours)
-    summary = fetch_weather_summary(conn, target_site, table="raw_weather")
+    rows = await fetch_raw_rows(conn, target_site, hours)
+    summary = await fetch_weather_summary(conn, target_site, table="raw_weather")
 
-    return {
-        "site": target_site,
-        "hours": hours,
-        "rows": rows,
-        "summary": summary,
-    }
+    return ORJSONResponse(
+        {
+            "site": target_site,
+            "hours": hours,
+            "rows": rows,
+            "summary": summary,
+        }
+    )
 
 
 # Combine raw vs silver counts for quick KPIs
 @app.get("/weather/metrics")
-def weather_metrics(
+async def weather_metrics(
     request: Request,
-    conn: psycopg2.extensions.connection = Depends(get_db_conn),
+    conn: psycopg.AsyncConnection = Depends(get_db_conn),
     site: Optional[str] = Query(None, description="Site identifier (defaults to SITE_NAME)"),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Return aggregate counts comparing raw and fact tables for a site."""
 
     target_site = site or request.app.state.default_site
-    sites = fetch_sites(conn)
+    sites = await _get_sites_cached(request, conn)
     if sites and target_site not in sites:
         raise HTTPException(status_code=404, detail=f"Unknown site '{target_site}'")
 
-    raw_summary = fetch_weather_summary(conn, target_site, table="raw_weather")
-    fact_summary = fetch_weather_summary(conn, target_site, table="fact_weather")
-    raw_rows = raw_summary["row_count"]
-    fact_rows = fact_summary["row_count"]
-    kept_pct = (fact_rows / raw_rows * 100.0) if raw_rows else None
-    dropped_rows = raw_rows - fact_rows if raw_rows else 0
+    raw_summary, fact_summary = await fetch_raw_and_fact_summaries(conn, target_site)
+    return ORJSONResponse(_metrics_payload(target_site, raw_summary, fact_summary))
 
-    return {
-        "site": target_site,
-        "raw": raw_summary,
-        "fact": fact_summary,
-        "dropped_rows": max(dropped_rows, 0),
-        "kept_percentage": kept_pct,
-    }
+
+# Everything a dashboard page needs for one (site, hours) window in a single round-trip
+@app.get("/weather/bundle")
+async def weather_bundle(
+    request: Request,
+    conn: psycopg.AsyncConnection = Depends(get_db_conn),
+    site: Optional[str] = Query(None, description="Site identifier (defaults to SITE_NAME)"),
+    hours: int = Query(24, ge=1, le=336, description="Number of hours to return"),
+) -> ORJSONResponse:
+    """Return raw rows, hourly rows and raw vs fact metrics for the requested site."""
+
+    target_site = site or request.app.state.default_site
+    sites = await _get_sites_cached(request, conn)
+    if sites and target_site not in sites:
+        raise HTTPException(status_code=404, detail=f"Unknown site '{target_site}'")
+
+    raw_rows = await fetch_raw_rows(conn, target_site, hours)
+    hourly_rows = await fetch_hourly_rows(conn, target_site, hours)
+    raw_summary, fact_summary = await fetch_raw_and_fact_summaries(conn, target_site)
+
+    return ORJSONResponse(
+        {
+            "site": target_site,
+            "hours": hours,
+            "raw": {"rows": raw_rows, "summary": raw_summary},
+            "hourly": {"rows": hourly_rows, "summary": fact_summary},
+            "metrics": _metrics_payload(target_site, raw_summary, fact_summary),
+        }
+    )
 
 
 @app.get("/streamlit-proxy")
-async def streamlit_proxy() -> dict[str, str]:
+async def streamlit_proxy(request: Request) -> dict[str, str]:
     """Confirm the dashboard is reachable from the API container."""
 
     streamlit_url = os.getenv("STREAMLIT_SERVER_URL", "http://streamlit:8501")
 
     try:
-        async with httpx.AsyncClient(timeout=API_TIMEOUT_SECONDS) as client:
-            response = await client.get(streamlit_url)
-            response.raise_for_status()
+        response = await request.app.state.http.get(streamlit_url)
+        response.raise_for_status()
     except Exception as exc:  # pylint: disable=broad-except
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
@@ -0,0 +1,38 @@
+"""Compiled numeric kernels for the Silver cleaner (Numba when available, NumPy otherwise)."""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to vectorised NumPy
+    njit = None
+
+
+GHI_MIN = 0.0
+TEMP_MIN, TEMP_MAX = -80.0, 80.0
+WIND_MIN = 0.0
+
+
+# NaN fails every comparison, so missing values are dropped too
+def _keep_mask_numpy(ghi: np.ndarray, t2m: np.ndarray, ws: np.ndarray) -> np.ndarray:
+    return (ghi >= GHI_MIN) & (t2m >= TEMP_MIN) & (t2m <= TEMP_MAX) & (ws >= WIND_MIN)
+
+
+# One fused pass with the same rules. fastmath is deliberately off because it lets LLVM assume
+# NaN never occurs.
+def _keep_mask_loop(ghi: np.ndarray, t2m: np.ndarray, ws: np.ndarray) -> np.ndarray:
+    n = ghi.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in range(n):
+        out[i] = (
+            ghi[i] >= GHI_MIN
+            and t2m[i] >= TEMP_MIN
+            and t2m[i] <= TEMP_MAX
+            and ws[i] >= WIND_MIN
+        )
+    return out
+
+
+keep_mask = njit(cache=True)(_keep_mask_loop) if njit is not None else _keep_mask_numpy
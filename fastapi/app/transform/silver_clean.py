@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import io
 import os
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import psycopg2
-import psycopg2.extras
 from dotenv import load_dotenv
 
+from app.etl.pgcopy import copy_upsert, refresh_weather_summary
+from app.transform._silver_kernels import keep_mask
+
 
 # -------- helpers ----------
 
@@ -38,98 +42,78 @@ SELECT site, ts_utc, ghi_wm2, t2m_c, ws10_mps, ingested_at
 FROM raw_weather
 WHERE site = %(site)s
   AND ts_utc >= %(start_ts)s
-  AND ts_utc <  %(end_ts)s;
+  AND ts_utc <  %(end_ts)s
 """
 
+RAW_DTYPES = {"site": object, "ghi_wm2": "float64", "t2m_c": "float64", "ws10_mps": "float64"}
+
 
 # -------- write silver (upsert) ----------
 
-UPSERT_SQL = """
-INSERT INTO fact_weather (site, ts_utc, ghi_wm2, temp_c, wind_mps)
-VALUES %s
-ON CONFLICT (site, ts_utc) DO UPDATE
-SET ghi_wm2 = EXCLUDED.ghi_wm2,
-    temp_c  = EXCLUDED.temp_c,
-    wind_mps= EXCLUDED.wind_mps;
-"""
+FACT_WEATHER_COLUMNS = ("site", "ts_utc", "ghi_wm2", "temp_c", "wind_mps")
 
 
-# Pull candidate Bronze rows for the requested site/date window
+# Pull candidate Bronze rows for the requested site/date window.
+# COPY ... TO STDOUT streams CSV that read_csv parses straight into typed columns.
 def fetch_raw(site: str, start_dt: dt.datetime, end_dt: dt.datetime) -> pd.DataFrame:
+    buf = io.StringIO()
     with get_conn() as conn, conn.cursor() as cur:
-        cur.execute(RAW_SQL, {"site": site, "start_ts": start_dt, "end_ts": end_dt})
-        rows = cur.fetchall()
+        query = cur.mogrify(RAW_SQL, {"site": site, "start_ts": start_dt, "end_ts": end_dt}).decode()
+        cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER)", buf)
+    buf.seek(0)
 
-    if not rows:
-        return pd.DataFrame(columns=["site", "ts_utc", "ghi_wm2", "t2m_c", "ws10_mps", "ingested_at"])
-
-    df = pd.DataFrame(rows, columns=["site", "ts_utc", "ghi_wm2", "t2m_c", "ws10_mps", "ingested_at"])
-    df["ghi_wm2"] = pd.to_numeric(df["ghi_wm2"], errors="coerce")
-    df["t2m_c"] = pd.to_numeric(df["t2m_c"], errors="coerce")
-    df["ws10_mps"] = pd.to_numeric(df["ws10_mps"], errors="coerce")
+    df = pd.read_csv(buf, dtype=RAW_DTYPES)
+    df["ts_utc"] = pd.to_datetime(df["ts_utc"], utc=True, format="ISO8601")
+    df["ingested_at"] = pd.to_datetime(df["ingested_at"], utc=True, format="ISO8601")
     return df
 
 
-# Apply quality rules and collapse multiple raw samples into hourly silver rows
+# Apply quality rules and collapse multiple raw samples into hourly silver rows.
+# Consumes df: columns are rewritten in place instead of working on a defensive copy.
 def clean_to_hourly(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    df = df.copy()
-
-    # 1) ensure UTC tz
-    df["ts_utc"] = pd.to_datetime(df["ts_utc"], utc=True)
+    # 1) ensure UTC tz and force top-of-hour bins (e.g., 14:37 -> 14:00)
+    df["ts_utc"] = pd.to_datetime(df["ts_utc"], utc=True).dt.floor("h")
     df["ingested_at"] = pd.to_datetime(df["ingested_at"], utc=True)
 
-    # 2) force top-of-hour bins (e.g., 14:37 -> 14:00)
-    df["ts_hour"] = df["ts_utc"].dt.floor("h")
-
-    # 3) validate ranges
-    df.loc[df["ghi_wm2"] < 0, "ghi_wm2"] = pd.NA
-    df.loc[df["t2m_c"] < -80, "t2m_c"] = pd.NA
-    df.loc[df["t2m_c"] > 80, "t2m_c"] = pd.NA
-    df.loc[df["ws10_mps"] < 0, "ws10_mps"] = pd.NA
-
-    # 4) drop rows missing any critical value
-    df = df.dropna(subset=["ghi_wm2", "t2m_c", "ws10_mps"])
+    # 2-3) validate ranges and drop rows missing any critical value, in one compiled pass
+    keep = keep_mask(
+        df["ghi_wm2"].to_numpy(dtype=np.float64),
+        df["t2m_c"].to_numpy(dtype=np.float64),
+        df["ws10_mps"].to_numpy(dtype=np.float64),
+    )
+    df = df[keep]
 
     if df.empty:
         return df
 
-    # 5) de-duplicate -> one row per (site, ts_hour) keeping latest ingested_at
-    df = df.sort_values(["site", "ts_hour", "ingested_at"])
-    df = df.groupby(["site", "ts_hour"], as_index=False).last()
-
-    # Drop original ts_utc column; the floored timestamp becomes the canonical hour stamp
-    df = df.drop(columns=["ts_utc"], errors="ignore")
-
-    # 6) rename to silver schema columns
-    df = df.rename(
-        columns={
-            "ts_hour": "ts_utc",
-            "t2m_c": "temp_c",
-            "ws10_mps": "wind_mps",
-        }
-    )[["site", "ts_utc", "ghi_wm2", "temp_c", "wind_mps"]]
+    # 4) de-duplicate -> one row per (site, hour) keeping latest ingested_at
+    df = df.sort_values("ingested_at", kind="stable").drop_duplicates(["site", "ts_utc"], keep="last")
+    df = df.sort_values(["site", "ts_utc"])
 
-    # 7) final sanity: hourly alignment and types
-    ts_series = pd.to_datetime(df["ts_utc"], utc=True)
-    assert (ts_series.dt.minute == 0).all(), "Non-hourly timestamp found"
-    assert ts_series.dt.tz is not None, "Timestamps must be timezone-aware (UTC)"
+    # 5) rename to silver schema columns
+    df = df.rename(columns={"t2m_c": "temp_c", "ws10_mps": "wind_mps"})[
+        ["site", "ts_utc", "ghi_wm2", "temp_c", "wind_mps"]
+    ]
 
-    df["ts_utc"] = ts_series
+    # 6) final sanity: types (hourly alignment is guaranteed by dt.floor above)
+    assert df["ts_utc"].dt.tz is not None, "Timestamps must be timezone-aware (UTC)"
     return df
 
 
-# Load the cleaned rows into fact_weather, leveraging UPSERT for idempotency
+# Load the cleaned rows into fact_weather via COPY + UPSERT for idempotency
 def upsert_fact_weather(df: pd.DataFrame) -> int:
     if df.empty:
         return 0
 
-    tuples = [tuple(row) for row in df.itertuples(index=False, name=None)]
+    # Object array rows feed COPY directly; no per-row tuple materialisation via itertuples
+    rows = df[list(FACT_WEATHER_COLUMNS)].to_numpy(dtype=object)
     with get_conn() as conn, conn.cursor() as cur:
-        psycopg2.extras.execute_values(cur, UPSERT_SQL, tuples, page_size=1000)
-    return len(tuples)
+        copy_upsert(cur, "fact_weather", FACT_WEATHER_COLUMNS, rows, conflict_columns=("site", "ts_utc"))
+        refresh_weather_summary(cur, "fact_weather", df["site"].unique())
+    return len(rows)
 
 
 # Orchestrate the end-to-end transform from Bronze window to Silver upsert
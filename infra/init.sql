@@ -38,6 +38,22 @@ CREATE INDEX IF NOT EXISTS idx_fact_weather_site_ts ON fact_weather (site, ts_ut
 
 -- Why: one clean, hourly row per site with strict ranges and hourly binning.
 
+-- =========================
+-- Per-site row counts / time span for raw_weather and fact_weather
+-- =========================
+CREATE TABLE IF NOT EXISTS weather_summary (
+  table_name    TEXT            NOT NULL CHECK (table_name IN ('raw_weather','fact_weather')),
+  site          TEXT            NOT NULL,
+  row_count     BIGINT          NOT NULL CHECK (row_count >= 0),
+  first_ts      TIMESTAMPTZ,
+  latest_ts     TIMESTAMPTZ,
+  refreshed_at  TIMESTAMPTZ     NOT NULL DEFAULT NOW(),
+  CONSTRAINT pk_weather_summary PRIMARY KEY (table_name, site)
+);
+
+-- Why: refreshed by the Bronze/Silver writers so API summaries are a key lookup,
+-- not a COUNT/MIN/MAX scan per request.
+
 -- =========================
 -- Gold (features)
 -- =========================
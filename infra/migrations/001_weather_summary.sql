@@ -0,0 +1,40 @@
+-- =========================
+-- Migration: weather_summary for databases created before the table existed
+-- =========================
+-- Idempotent: safe to re-run; each run recomputes the summary rows from the source tables.
+-- Usage: docker compose exec -T db sh -c 'psql -U "$POSTGRES_USER" -d "$POSTGRES_DB"' < infra/migrations/001_weather_summary.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS weather_summary (
+  table_name    TEXT            NOT NULL CHECK (table_name IN ('raw_weather','fact_weather')),
+  site          TEXT            NOT NULL,
+  row_count     BIGINT          NOT NULL CHECK (row_count >= 0),
+  first_ts      TIMESTAMPTZ,
+  latest_ts     TIMESTAMPTZ,
+  refreshed_at  TIMESTAMPTZ     NOT NULL DEFAULT NOW(),
+  CONSTRAINT pk_weather_summary PRIMARY KEY (table_name, site)
+);
+
+-- Backfill from the existing Bronze and Silver rows
+INSERT INTO weather_summary (table_name, site, row_count, first_ts, latest_ts)
+SELECT 'raw_weather', site, COUNT(*), MIN(ts_utc), MAX(ts_utc)
+FROM raw_weather
+GROUP BY site
+ON CONFLICT (table_name, site) DO UPDATE
+SET row_count = EXCLUDED.row_count,
+    first_ts  = EXCLUDED.first_ts,
+    latest_ts = EXCLUDED.latest_ts,
+    refreshed_at = NOW();
+
+INSERT INTO weather_summary (table_name, site, row_count, first_ts, latest_ts)
+SELECT 'fact_weather', site, COUNT(*), MIN(ts_utc), MAX(ts_utc)
+FROM fact_weather
+GROUP BY site
+ON CONFLICT (table_name, site) DO UPDATE
+SET row_count = EXCLUDED.row_count,
+    first_ts  = EXCLUDED.first_ts,
+    latest_ts = EXCLUDED.latest_ts,
+    refreshed_at = NOW();
+
+COMMIT;
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import math
 import os
-from typing import Any, Dict, List, Tuple
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.graph_objects as go
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 
 st.set_page_config(page_title="Climate Dashboard", layout="wide", page_icon=":sunny:")
 
@@ -18,221 +24,44 @@ DEFAULT_SITE = os.getenv("SITE_NAME", "chicago_il")
 HEALTH_ENDPOINT = f"{API_BASE_URL}/health"
 ROOT_ENDPOINT = f"{API_BASE_URL}/"
 
-# Tailwind-inspired theme to mimic the Weather Dashboard look
-CUSTOM_CSS = """
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;900&display=swap');
-
-:root {
-  --bg: #050d16;
-  --panel: #101f30;
-  --panel-soft: rgba(15, 30, 45, 0.85);
-  --accent: #1193d4;
-  --accent-soft: rgba(17, 147, 212, 0.18);
-  --text-strong: #f8fbff;
-  --text-muted: #9fb9d4;
-}
-
-body {
-  font-family: "Inter", sans-serif;
-}
-
-[data-testid="stAppViewContainer"] {
-  background: radial-gradient(circle at 12% 18%, #14314d 0%, #07111a 55%, #050b11 100%);
-  color: var(--text-muted);
-}
-
-[data-testid="stSidebar"] {
-  background: linear-gradient(180deg, #091522 0%, #050b11 100%);
-  border-right: 1px solid rgba(17, 147, 212, 0.18);
-}
-
-.sidebar-header {
-  display: flex;
-  align-items: center;
-  gap: 12px;
-  margin-bottom: 32px;
-  padding: 4px 6px;
-}
-
-.sidebar-logo {
-  width: 34px;
-  height: 34px;
-  border-radius: 10px;
-  background: rgba(17, 147, 212, 0.18);
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  color: var(--text-strong);
-  font-weight: 700;
-}
-
-.sidebar-title {
-  font-size: 1.05rem;
-  font-weight: 700;
-  color: var(--text-strong);
-}
-
-[data-testid="stSidebar"] div[role="radiogroup"] {
-  display: flex;
-  flex-direction: column;
-  gap: 8px;
-}
-
-[data-testid="stSidebar"] div[role="radiogroup"] > label {
-  margin-bottom: 0;
-}
-
-[data-testid="stSidebar"] div[role="radio"] {
-  background: rgba(10, 21, 32, 0.9);
-  border: 1px solid rgba(17, 147, 212, 0.1);
-  border-radius: 12px;
-  padding: 10px 14px;
-  color: var(--text-muted);
-  font-weight: 600;
-  transition: border 0.15s ease, background 0.15s ease, color 0.15s ease;
-}
-
-[data-testid="stSidebar"] div[role="radio"]:hover {
-  border-color: rgba(17, 147, 212, 0.35);
-}
-
-[data-testid="stSidebar"] div[role="radio"][aria-checked="true"] {
-  background: rgba(17, 147, 212, 0.22);
-  border-color: rgba(17, 147, 212, 0.7);
-  color: var(--text-strong);
-}
-
-.sidebar-footer {
-  margin-top: 40px;
-  display: flex;
-  align-items: center;
-  gap: 12px;
-  padding: 14px 16px;
-  border-radius: 14px;
-  background: rgba(17, 147, 212, 0.12);
-}
-
-.sidebar-footer img {
-  width: 42px;
-  height: 42px;
-  border-radius: 50%;
-  object-fit: cover;
-}
-
-.hero-heading {
-  color: var(--text-strong);
-  font-size: 2rem;
-  font-weight: 800;
-  margin-bottom: 4px;
-}
-
-.hero-subtitle {
-  color: var(--text-muted);
-  font-size: 0.95rem;
-}
-
-.slider-wrap {
-  background: rgba(10, 25, 37, 0.85);
-  border-radius: 14px;
-  padding: 10px 18px;
-  border: 1px solid rgba(17, 147, 212, 0.18);
-  margin-bottom: 12px;
-}
-
-.dashboard-card {
-  border-radius: 18px;
-  border: 1px solid rgba(17, 147, 212, 0.18);
-  background: linear-gradient(180deg, rgba(15, 30, 45, 0.95) 0%, rgba(9, 20, 30, 0.95) 100%);
-  box-shadow: 0 24px 40px -32px rgba(17, 147, 212, 0.9);
-  padding: 22px 24px;
-  margin-bottom: 16px;
-}
-
-.dashboard-card .metric-title {
-  text-transform: uppercase;
-  letter-spacing: 0.12em;
-  font-size: 0.78rem;
-  color: var(--text-muted);
-}
-
-.dashboard-card .metric-value {
-  color: var(--text-strong);
-  font-size: 2.4rem;
-  font-weight: 700;
-  margin-top: 8px;
-}
-
-.metric-delta {
-  font-size: 0.9rem;
-  margin-left: 10px;
-  padding: 2px 12px;
-  border-radius: 999px;
-  font-weight: 600;
-}
-.metric-delta.positive { background: rgba(34, 197, 94, 0.16); color: #22c55e; }
-.metric-delta.negative { background: rgba(239, 68, 68, 0.16); color: #ef4444; }
-.metric-delta.neutral { background: rgba(148, 163, 184, 0.18); color: #cbd5f5; }
-
-.analysis-card {
-  border-radius: 18px;
-  border: 1px solid rgba(17, 147, 212, 0.18);
-  background: linear-gradient(180deg, rgba(15, 30, 45, 0.95) 0%, rgba(7, 16, 24, 0.95) 100%);
-  padding: 22px 24px;
-  margin-bottom: 20px;
-}
-
-.analysis-card .card-header {
-  display: flex;
-  justify-content: space-between;
-  align-items: flex-start;
-  margin-bottom: 16px;
-}
-
-.analysis-card h3 {
-  color: var(--text-strong);
-  font-size: 1.05rem;
-  font-weight: 600;
-  margin-bottom: 4px;
-}
-
-.analysis-card p.subtle {
-  color: var(--text-muted);
-  font-size: 0.85rem;
-}
+# Built page payloads kept per browser session (oldest evicted first)
+SESSION_CACHE_MAX_ENTRIES = 8
 
-.analysis-card .legend-muted {
-  display: flex;
-  gap: 16px;
-  color: var(--text-muted);
-  font-size: 0.85rem;
-}
+# Tailwind-inspired theme to mimic the Weather Dashboard look
+THEME_CSS_PATH = Path(__file__).resolve().parent / "static" / "theme.css"
 
-.analysis-card .legend-dot {
-  width: 10px;
-  height: 10px;
-  border-radius: 999px;
-  display: inline-block;
-  margin-right: 6px;
-}
 
-footer {visibility: hidden;}
-</style>
-"""
+# Streamlit re-executes this script on every rerun, so per-process singletons (theme, HTTP session)
+# live in st.cache_resource rather than module globals or lru_cache
+@st.cache_resource(show_spinner=False)
+def _theme_css() -> str:
+    return THEME_CSS_PATH.read_text(encoding="utf-8")
 
 
 def inject_styles() -> None:
     if st.session_state.get("_custom_css_injected"):
         return
-    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    st.markdown(f"<style>\n{_theme_css()}</style>", unsafe_allow_html=True)
     st.session_state["_custom_css_injected"] = True
 
 
+# Pooled keep-alive session so cache misses skip a new TCP setup to the API
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip"
+    return session
+
+
 @st.cache_data(ttl=30)
 def fetch_json(url: str, params: Dict[str, Any] | None = None, timeout: int = 10) -> Dict[str, Any]:
-    response = requests.get(url, params=params, timeout=timeout)
+    response = _http_session().get(url, params=params, timeout=timeout)
     response.raise_for_status()
-    return response.json()
+    # orjson decodes the large row lists several times faster than the stdlib json module
+    return orjson.loads(response.content)
 
 
 @st.cache_data(ttl=60)
@@ -246,14 +75,70 @@ def fetch_metrics(site: str) -> Dict[str, Any]:
     return fetch_json(f"{API_BASE_URL}/weather/metrics", params={"site": site})
 
 
+# One request for a page's raw rows, hourly rows and metrics instead of one per resource
 @st.cache_data(ttl=60)
-def fetch_raw_weather(site: str, hours: int) -> Dict[str, Any]:
-    return fetch_json(f"{API_BASE_URL}/weather/raw", params={"site": site, "hours": hours})
-
-
-@st.cache_data(ttl=60)
-def fetch_hourly_weather(site: str, hours: int) -> Dict[str, Any]:
-    return fetch_json(f"{API_BASE_URL}/weather/hourly", params={"site": site, "hours": hours})
+def fetch_bundle(site: str, hours: int) -> Dict[str, Any]:
+    return fetch_json(f"{API_BASE_URL}/weather/bundle", params={"site": site, "hours": hours})
+
+
+# Weather value columns held as float32 for display: half the bytes of float64. Values fed to the
+# cleaning analysis stay float64 so bound checks match the Silver job exactly.
+FLOAT32_COLUMNS = ("ghi_wm2", "t2m_c", "ws10_mps", "temp_c", "wind_mps")
+
+
+# Pivot API row dicts into column lists so pandas adopts whole columns instead of scanning each dict
+def _rows_to_frame(rows: List[Dict[str, Any]], *, float32: bool = True) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame.from_dict({key: [row.get(key) for row in rows] for key in rows[0]}, orient="columns")
+    for column in FLOAT32_COLUMNS if float32 else ():
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(np.float32)
+    return df
+
+
+# Reason codes produced by _classify; index into REASON_LABELS for the display strings
+REASON_LABELS = (
+    "kept",
+    "invalid_ghi",
+    "invalid_temp",
+    "invalid_wind",
+    "missing_ghi",
+    "missing_temp",
+    "missing_wind",
+    "duplicate",
+)
+REASON_DTYPE = pd.CategoricalDtype(REASON_LABELS, ordered=True)
+KEPT, INVALID_GHI, INVALID_TEMP, INVALID_WIND, MISSING_GHI, MISSING_TEMP, MISSING_WIND, DUPLICATE = range(8)
+
+
+# Tag each row with the first silver rule it fails, nulling the offending value in place.
+# np.select assigns every code in one pass, first matching rule wins.
+def _classify(ghi: np.ndarray, temp: np.ndarray, wind: np.ndarray) -> np.ndarray:
+    ghi_bad = ghi < 0
+    temp_bad = (temp < -80) | (temp > 80)
+    wind_bad = wind < 0
+    reason = np.select(
+        [ghi_bad, temp_bad, wind_bad, np.isnan(ghi), np.isnan(temp), np.isnan(wind)],
+        [INVALID_GHI, INVALID_TEMP, INVALID_WIND, MISSING_GHI, MISSING_TEMP, MISSING_WIND],
+        default=KEPT,
+    ).astype(np.int8)
+    ghi[ghi_bad] = np.nan
+    temp[reason == INVALID_TEMP] = np.nan
+    wind[reason == INVALID_WIND] = np.nan
+    return reason
+
+
+# Parse to tz-aware UTC unless the column already is
+def _as_utc(ts: pd.Series) -> pd.Series:
+    if isinstance(ts.dtype, pd.DatetimeTZDtype):
+        return ts.dt.tz_convert("UTC")
+    return pd.to_datetime(ts, utc=True)
+
+
+# Epoch milliseconds: a date axis reads integers as ms, which serialise far smaller than ISO strings
+def _epoch_ms(ts: pd.Series) -> np.ndarray:
+    return _as_utc(ts).to_numpy(dtype="datetime64[ns]").astype("datetime64[ms]").astype(np.int64)
 
 
 # Mirror silver cleaning rules so dashboards can explain drops
@@ -261,55 +146,74 @@ def analyse_cleaning(raw_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame,
     if raw_df.empty:
         return raw_df, raw_df, {}
 
-    df = raw_df.copy()
-    df["ts_utc"] = pd.to_datetime(df["ts_utc"], utc=True)
-    df["ingested_at"] = pd.to_datetime(df["ingested_at"], utc=True)
-    df["ts_hour"] = df["ts_utc"].dt.floor("h")
-    df["reason"] = "kept"
-
-    for col in ("ghi_wm2", "t2m_c", "ws10_mps"):
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    invalid_ghi = (df["ghi_wm2"] < 0) & df["reason"].eq("kept")
-    df.loc[invalid_ghi, "reason"] = "invalid_ghi"
-    df.loc[invalid_ghi, "ghi_wm2"] = pd.NA
-
-    invalid_temp = ((df["t2m_c"] < -80) | (df["t2m_c"] > 80)) & df["reason"].eq("kept")
-    df.loc[invalid_temp, "reason"] = "invalid_temp"
-    df.loc[invalid_temp, "t2m_c"] = pd.NA
-
-    invalid_wind = (df["ws10_mps"] < 0) & df["reason"].eq("kept")
-    df.loc[invalid_wind, "reason"] = "invalid_wind"
-    df.loc[invalid_wind, "ws10_mps"] = pd.NA
-
-    for col, label in (
-        ("ghi_wm2", "missing_ghi"),
-        ("t2m_c", "missing_temp"),
-        ("ws10_mps", "missing_wind"),
-    ):
-        missing = df[col].isna() & df["reason"].eq("kept")
-        df.loc[missing, "reason"] = label
-
-    kept_df = df[df["reason"].eq("kept")].copy()
-    if not kept_df.empty:
-        kept_sorted = kept_df.sort_values(["site", "ts_hour", "ingested_at"])
-        duplicate_mask = kept_sorted.duplicated(subset=["site", "ts_hour"], keep="last")
-        dup_indices = kept_sorted.index[duplicate_mask]
-        df.loc[dup_indices, "reason"] = "duplicate"
-        kept_df = df[df["reason"].eq("kept")].copy()
-
-    kept_df = kept_df.sort_values(["site", "ts_hour"])
-    cleaned_df = kept_df[["site", "ts_hour", "ghi_wm2", "t2m_c", "ws10_mps"]].rename(
-        columns={"ts_hour": "ts_utc", "t2m_c": "temp_c", "ws10_mps": "wind_mps"}
+    # Work on column arrays and build the output frames once at the end
+    site = raw_df["site"].to_numpy()
+    # Second resolution is lossless for hourly display data and halves the bytes moved
+    ts_utc = _as_utc(raw_df["ts_utc"]).array.as_unit("s")
+    ingested_at = _as_utc(raw_df["ingested_at"]).array
+    ts_hour = ts_utc.floor("h")
+
+    # Classify in float64 like the Silver job (float32 rounds 80.000001 to 80), then downcast for display
+    ghi = pd.to_numeric(raw_df["ghi_wm2"], errors="coerce").to_numpy(dtype=np.float64, copy=True)
+    temp = pd.to_numeric(raw_df["t2m_c"], errors="coerce").to_numpy(dtype=np.float64, copy=True)
+    wind = pd.to_numeric(raw_df["ws10_mps"], errors="coerce").to_numpy(dtype=np.float64, copy=True)
+    reason = _classify(ghi, temp, wind)
+    ghi, temp, wind = (values.astype(np.float32) for values in (ghi, temp, wind))
+
+    kept_idx = np.flatnonzero(reason == KEPT)
+    if kept_idx.size:
+        keys = pd.DataFrame(
+            {"site": site[kept_idx], "ts_hour": ts_hour[kept_idx], "ingested_at": ingested_at[kept_idx]},
+            copy=False,
+        )
+        # Hash groupby instead of a sort: the latest ingest per (site, hour) wins. Scanning in
+        # reverse hands ties to the later row, matching the Silver job's stable sort + keep="last".
+        latest = keys.iloc[::-1].groupby(["site", "ts_hour"], sort=False)["ingested_at"].idxmax().to_numpy()
+        duplicate = np.ones(kept_idx.size, dtype=bool)
+        duplicate[latest] = False
+        reason[kept_idx[duplicate]] = DUPLICATE
+        kept_idx = np.flatnonzero(reason == KEPT)
+
+    columns = {column: raw_df[column] for column in raw_df.columns}
+    columns.update(
+        ts_utc=ts_utc,
+        ingested_at=ingested_at,
+        ghi_wm2=ghi,
+        t2m_c=temp,
+        ws10_mps=wind,
+        ts_hour=ts_hour,
+        reason=np.take(np.array(REASON_LABELS, dtype=object), reason),
     )
-    cleaned_df["ts_utc"] = pd.to_datetime(cleaned_df["ts_utc"], utc=True)
+    df = pd.DataFrame(columns, index=raw_df.index, copy=False)
 
-    drop_counts = df["reason"].value_counts().to_dict()
+    cleaned_df = pd.DataFrame(
+        {
+            "site": site[kept_idx],
+            "ts_utc": ts_hour[kept_idx],
+            "ghi_wm2": ghi[kept_idx],
+            "temp_c": temp[kept_idx],
+            "wind_mps": wind[kept_idx],
+        },
+        index=raw_df.index[kept_idx],
+        copy=False,
+    ).sort_values(["site", "ts_utc"])
+
+    # Count the int8 codes directly, most frequent first so callers need not re-sort
+    codes, counts = np.unique(reason, return_counts=True)
+    order = np.argsort(-counts, kind="stable")
+    drop_counts = {REASON_LABELS[code]: int(count) for code, count in zip(codes[order], counts[order])}
     drop_counts.setdefault("kept", len(cleaned_df))
 
     return df, cleaned_df, drop_counts
 
 
+# Keyed on (site, hours) so reruns reuse the analysis instead of hashing the DataFrame
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_analyse_cleaning(site: str, hours: int) -> tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    raw_df = _rows_to_frame(fetch_bundle(site, hours).get("raw", {}).get("rows", []), float32=False)
+    return analyse_cleaning(raw_df)
+
+
 def _format_metric(value: float) -> str:
     if value is None or math.isnan(value):
         return "--"
@@ -327,68 +231,118 @@ def _format_delta(delta: float) -> Tuple[str, str]:
     return magnitude, status
 
 
+def _float_array(df: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in df.columns:
+        return np.empty(0, dtype=np.float32)
+    return df[column].to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+# NaN mean that returns NaN (without a RuntimeWarning) for empty or all-missing columns
+def _nanmean(values: np.ndarray) -> float:
+    if not values.size or np.isnan(values).all():
+        return math.nan
+    return float(np.nanmean(values))
+
+
 # KPI summary cards showing average clean vs raw values and deltas
-def _render_metric_cards(raw_df: pd.DataFrame, fact_df: pd.DataFrame, hours: int) -> None:
+def _metric_cards_html(raw_df: pd.DataFrame, fact_df: pd.DataFrame, hours: int) -> List[str]:
     metric_specs = [
         ("Solar Irradiance (W/m^2)", "ghi_wm2", "ghi_wm2"),
         ("Temperature (degC)", "t2m_c", "temp_c"),
         ("Wind Speed (m/s)", "ws10_mps", "wind_mps"),
     ]
-    card_cols = st.columns(len(metric_specs))
-    for col, (title, raw_col, clean_col) in zip(card_cols, metric_specs):
-        raw_mean = raw_df[raw_col].mean()
-        clean_mean = fact_df[clean_col].mean() if not fact_df.empty and clean_col in fact_df.columns else math.nan
+    # Pull each column out as a float array once and average with NumPy instead of pandas reductions
+    raw_arrays = {raw_col: _float_array(raw_df, raw_col) for _, raw_col, _ in metric_specs}
+    clean_arrays = {clean_col: _float_array(fact_df, clean_col) for _, _, clean_col in metric_specs}
+    cards = []
+    for title, raw_col, clean_col in metric_specs:
+        raw_mean = _nanmean(raw_arrays[raw_col])
+        clean_mean = _nanmean(clean_arrays[clean_col])
         delta_pct = ((clean_mean - raw_mean) / raw_mean * 100) if raw_mean not in (0, None) else math.nan
         formatted_value = _format_metric(clean_mean)
         delta_text, delta_status = _format_delta(delta_pct)
-        col.markdown(
+        cards.append(
             f"""
             <div class="dashboard-card">
               <div class="metric-title">{title}</div>
               <div class="metric-value">{formatted_value}<span class="metric-delta {delta_status}">{delta_text}</span></div>
               <div style=\"color:var(--text-muted);font-size:0.82rem;margin-top:4px;\">Clean vs raw mean over {hours} hours</div>
             </div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
+    return cards
+
+
+def _render_metric_cards(cards: List[str]) -> None:
+    for col, card in zip(st.columns(len(cards)), cards):
+        col.markdown(card, unsafe_allow_html=True)
+
+
+# Layout shared by every trend chart, built once; each figure gets a shallow copy
+TREND_LAYOUT: Dict[str, Any] = {
+    "height": 320,
+    "margin": {"l": 8, "r": 8, "t": 8, "b": 8},
+    "plot_bgcolor": "#102335",
+    "paper_bgcolor": "#102335",
+    "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1, "font": {"color": "#9fb9d4"}},
+    "xaxis": {
+        "type": "date",
+        "color": "#6da2c8",
+        "gridcolor": "rgba(255,255,255,0.04)",
+        "showgrid": False,
+        "showspikes": True,
+        "spikecolor": "#1fb9ff",
+        "spikethickness": 1,
+    },
+    "yaxis": {
+        "color": "#6da2c8",
+        "gridcolor": "rgba(255,255,255,0.06)",
+        "showspikes": True,
+        "spikecolor": "#1fb9ff",
+        "spikethickness": 1,
+    },
+}
 
 
 # Reusable chart builder matching the mockup aesthetic
-def _styled_chart(title: str, subtitle: str, raw_df: pd.DataFrame, fact_df: pd.DataFrame, raw_col: str, clean_col: str) -> None:
-    fig = go.Figure()
+# raw_ms/fact_ms are epoch-millisecond x arrays computed once per render and shared by every chart
+def _styled_figure(
+    raw_df: pd.DataFrame,
+    raw_ms: np.ndarray,
+    fact_df: pd.DataFrame,
+    fact_ms: np.ndarray,
+    raw_col: str,
+    clean_col: str,
+) -> go.Figure:
+    traces = []
     if not fact_df.empty and clean_col in fact_df.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=fact_df["ts_utc"],
-                y=fact_df[clean_col],
-                name="Clean Data",
-                mode="lines",
-                line=dict(color="#1fb9ff", width=3),
-                fill="tozeroy",
-                fillcolor="rgba(31, 185, 255, 0.20)",
-            )
-        )
-    fig.add_trace(
-        go.Scatter(
-            x=raw_df["ts_utc"],
-            y=raw_df[raw_col],
-            name="Raw Data",
-            mode="lines",
-            line=dict(color="rgba(31, 185, 255, 0.38)", width=2, dash="dash"),
+        traces.append(
+            {
+                "type": "scatter",
+                "x": fact_ms,
+                "y": fact_df[clean_col],
+                "name": "Clean Data",
+                "mode": "lines",
+                "line": {"color": "#1fb9ff", "width": 3},
+                "fill": "tozeroy",
+                "fillcolor": "rgba(31, 185, 255, 0.20)",
+            }
         )
+    traces.append(
+        {
+            "type": "scatter",
+            "x": raw_ms,
+            "y": raw_df[raw_col],
+            "name": "Raw Data",
+            "mode": "lines",
+            "line": {"color": "rgba(31, 185, 255, 0.38)", "width": 2, "dash": "dash"},
+        }
     )
-    fig.update_layout(
-        height=320,
-        margin=dict(l=8, r=8, t=8, b=8),
-        plot_bgcolor="#102335",
-        paper_bgcolor="#102335",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(color="#9fb9d4")),
-        xaxis=dict(color="#6da2c8", gridcolor="rgba(255,255,255,0.04)", showgrid=False),
-        yaxis=dict(color="#6da2c8", gridcolor="rgba(255,255,255,0.06)")
-    )
-    fig.update_xaxes(showspikes=True, spikecolor="#1fb9ff", spikethickness=1)
-    fig.update_yaxes(showspikes=True, spikecolor="#1fb9ff", spikethickness=1)
+    # Plain dict specs skip the per-property validating constructors of go.Scatter/update_layout
+    return go.Figure({"data": traces, "layout": dict(TREND_LAYOUT)}, skip_invalid=True)
 
+
+def _styled_chart(title: str, subtitle: str, fig: go.Figure) -> None:
     st.markdown(
         f"""
         <div class="analysis-card">
@@ -409,6 +363,43 @@ def _styled_chart(title: str, subtitle: str, raw_df: pd.DataFrame, fact_df: pd.D
     st.plotly_chart(fig, use_container_width=True, theme=None)
 
 
+# Metric cards and figures for the trends page; None when the window has no raw rows
+def _build_trends_payload(site: str, hours: int) -> Tuple[List[str], List[Tuple[str, str, go.Figure]]] | None:
+    bundle = fetch_bundle(site, hours)
+    raw_rows = bundle.get("raw", {}).get("rows", [])
+    fact_rows = bundle.get("hourly", {}).get("rows", [])
+    if not raw_rows:
+        return None
+
+    raw_df = _rows_to_frame(raw_rows)
+    raw_ms = _epoch_ms(raw_df["ts_utc"])
+    fact_df = _rows_to_frame(fact_rows)
+    fact_ms = _epoch_ms(fact_df["ts_utc"]) if not fact_df.empty else np.empty(0, dtype=np.int64)
+
+    chart_specs = [
+        ("Solar Irradiance (W/m^2)", "Hourly irradiance with cleaning overlay", "ghi_wm2", "ghi_wm2"),
+        ("Temperature (degC)", "Cleaned temperature remains within QC bounds", "t2m_c", "temp_c"),
+        ("Wind Speed (m/s)", "Wind smoothing removes negative spikes", "ws10_mps", "wind_mps"),
+    ]
+    charts = [
+        (title, subtitle, _styled_figure(raw_df, raw_ms, fact_df, fact_ms, raw_col, clean_col))
+        for title, subtitle, raw_col, clean_col in chart_specs
+    ]
+    return _metric_cards_html(raw_df, fact_df, hours), charts
+
+
+# Per-session LRU of built page payloads so reruns from unrelated widgets skip figure assembly
+def _session_cached(key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+    cache = st.session_state.setdefault("_page_cache", OrderedDict())
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    value = cache[key] = build()
+    while len(cache) > SESSION_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+    return value
+
+
 # Primary page: mimic the provided Weather Dashboard mockup
 def render_weather_trends(site: str) -> None:
     st.markdown(
@@ -431,28 +422,18 @@ def render_weather_trends(site: str) -> None:
     )
     st.markdown("</div>", unsafe_allow_html=True)
 
-    raw_rows = fetch_raw_weather(site, hours).get("rows", [])
-    fact_rows = fetch_hourly_weather(site, hours).get("rows", [])
+    # The minute bucket expires entries in step with the 60s API caches
+    key = ("trends", site, hours, int(time.time() // 60))
+    payload = _session_cached(key, lambda: _build_trends_payload(site, hours))
 
-    if not raw_rows:
+    if payload is None:
         st.warning("No raw data for the selected window.")
         return
 
-    raw_df = pd.DataFrame(raw_rows)
-    raw_df["ts_utc"] = pd.to_datetime(raw_df["ts_utc"], utc=True)
-    fact_df = pd.DataFrame(fact_rows)
-    if not fact_df.empty:
-        fact_df["ts_utc"] = pd.to_datetime(fact_df["ts_utc"], utc=True)
-
-    _render_metric_cards(raw_df, fact_df, hours)
-
-    chart_specs = [
-        ("Solar Irradiance (W/m^2)", "Hourly irradiance with cleaning overlay", "ghi_wm2", "ghi_wm2"),
-        ("Temperature (degC)", "Cleaned temperature remains within QC bounds", "t2m_c", "temp_c"),
-        ("Wind Speed (m/s)", "Wind smoothing removes negative spikes", "ws10_mps", "wind_mps"),
-    ]
-    for title, subtitle, raw_col, clean_col in chart_specs:
-        _styled_chart(title, subtitle, raw_df, fact_df, raw_col, clean_col)
+    cards, charts = payload
+    _render_metric_cards(cards)
+    for title, subtitle, fig in charts:
+        _styled_chart(title, subtitle, fig)
 
 
 def render_data_health(site: str) -> None:
@@ -465,18 +446,15 @@ def render_data_health(site: str) -> None:
         step=24,
     )
 
-    raw_payload = fetch_raw_weather(site, hours)
-    fact_payload = fetch_hourly_weather(site, hours)
-    raw_df = pd.DataFrame(raw_payload.get("rows", []))
-    fact_df = pd.DataFrame(fact_payload.get("rows", []))
+    analysed_df, simulated_clean_df, drop_counts = cached_analyse_cleaning(site, hours)
+    fact_df = _rows_to_frame(fetch_bundle(site, hours).get("hourly", {}).get("rows", []))
 
-    if raw_df.empty:
+    if analysed_df.empty:
         st.warning("No raw data available for the selected window yet.")
         return
 
-    analysed_df, simulated_clean_df, drop_counts = analyse_cleaning(raw_df)
     cleaned_rows = len(simulated_clean_df)
-    raw_rows = len(raw_df)
+    raw_rows = len(analysed_df)
     fact_rows = len(fact_df)
     kept_pct = (cleaned_rows / raw_rows) * 100 if raw_rows else 0
 
@@ -485,13 +463,10 @@ def render_data_health(site: str) -> None:
     metric_cols[1].metric("Clean rows", fact_rows, f"{kept_pct:.1f}% of raw")
     metric_cols[2].metric("Window", f"{hours} hours")
 
-    drop_df = (
-        pd.Series(drop_counts, name="count")
-        .rename_axis("reason")
-        .reset_index()
-        .replace({"kept": "kept"})
+    # drop_counts arrives most frequent first, so no re-sort is needed
+    drop_df = pd.DataFrame({"reason": list(drop_counts), "count": list(drop_counts.values())}).astype(
+        {"reason": REASON_DTYPE}
     )
-    drop_df = drop_df.sort_values("count", ascending=False)
 
     kept_value = drop_df.loc[drop_df["reason"] == "kept", "count"].sum()
     non_kept = drop_df[drop_df["reason"] != "kept"].copy()
@@ -516,14 +491,9 @@ def render_data_health(site: str) -> None:
     )
     st.bar_chart(comparison_df.set_index("stage"))
 
-    analysed_df["available"] = analysed_df[["ghi_wm2", "t2m_c", "ws10_mps"]].notna().all(axis=1)
-    completeness = (
-        analysed_df.groupby("ts_hour")[["ghi_wm2", "t2m_c", "ws10_mps"]]
-        .agg(lambda x: int(x.notna().all()))
-        .reset_index()
-    )
+    notna = analysed_df[["ghi_wm2", "t2m_c", "ws10_mps"]].notna()
+    completeness = notna.groupby(analysed_df["ts_hour"]).all().astype(np.int8).reset_index()
     heatmap_df = completeness.melt(id_vars="ts_hour", var_name="variable", value_name="available")
-    heatmap_df["available"] = heatmap_df["available"].astype(int)
     st.subheader("Data completeness heatmap")
     st.write(
         go.Figure(
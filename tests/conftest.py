@@ -0,0 +1,30 @@
+import sys
+from importlib import util as importlib_util
+from pathlib import Path
+
+import pytest
+from streamlit import runtime  # type: ignore  # noqa: F401  (ensures streamlit caches are initialized if needed)
+
+_repo_root = Path(__file__).resolve().parents[1]
+_streamlit_app_path = _repo_root / "streamlit" / "app.py"
+
+# The API/ETL code imports itself as the top-level `app` package rooted at fastapi/
+sys.path.insert(0, str(_repo_root / "fastapi"))
+
+
+# Load the dashboard module once per session, directly from the repo, to avoid clashing with the
+# third-party streamlit package and re-running its top-level setup for every test file
+@pytest.fixture(scope="session")
+def app_module():
+    spec = importlib_util.spec_from_file_location("streamlit_dashboard_app", _streamlit_app_path)
+    assert spec and spec.loader  # narrow type checkers
+    module = importlib_util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Start every test with an empty fetch cache so results never leak between tests
+@pytest.fixture(autouse=True)
+def _clear_fetch_cache(app_module):
+    app_module.fetch_json.clear()
+    yield
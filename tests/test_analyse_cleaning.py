@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+
+def _raw_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "site": ["a"] * 7,
+            "ts_utc": [
+                "2025-01-01T00:00:00+00:00",
+                "2025-01-01T01:00:00+00:00",
+                "2025-01-01T02:00:00+00:00",
+                "2025-01-01T03:00:00+00:00",
+                "2025-01-01T04:00:00+00:00",
+                "2025-01-01T05:10:00+00:00",
+                "2025-01-01T05:40:00+00:00",
+            ],
+            "ghi_wm2": [-1.0, 10.0, 10.0, None, 10.0, 10.0, 12.0],
+            "t2m_c": [95.0, 120.0, 5.0, 5.0, 5.0, 5.0, 6.0],
+            "ws10_mps": [1.0, 1.0, -2.0, 1.0, 1.0, 1.0, 1.0],
+            "ingested_at": ["2025-01-02T00:00:00+00:00"] * 6 + ["2025-01-03T00:00:00+00:00"],
+        }
+    )
+
+
+def test_analyse_cleaning_tags_first_failing_rule(app_module):
+    analysed, cleaned, drop_counts = app_module.analyse_cleaning(_raw_frame())
+
+    assert analysed["reason"].tolist() == [
+        "invalid_ghi",
+        "invalid_temp",
+        "invalid_wind",
+        "missing_ghi",
+        "kept",
+        "duplicate",
+        "kept",
+    ]
+    # Only the value behind the recorded reason is nulled
+    assert np.isnan(analysed["ghi_wm2"].iloc[0]) and analysed["t2m_c"].iloc[0] == 95.0
+    assert cleaned["ghi_wm2"].tolist() == [10.0, 12.0]
+    assert drop_counts["kept"] == 2 and drop_counts["duplicate"] == 1
+
+
+def test_analyse_cleaning_applies_bounds_at_full_precision(app_module):
+    raw = _raw_frame().iloc[:3].assign(
+        ghi_wm2=[-1e-50, 10.0, 10.0],
+        t2m_c=[5.0, 80.000001, -80.0],
+        ws10_mps=[1.0, 1.0, 1.0],
+    )
+
+    analysed, _, _ = app_module.analyse_cleaning(raw)
+
+    # float32 would round both offending values onto the bounds and keep the rows
+    assert analysed["reason"].tolist() == ["invalid_ghi", "invalid_temp", "kept"]
+
+
+# Plain per-row restatement of the silver rules; codes index into REASON_LABELS
+def _classify_reference(ghi, temp, wind):
+    reason = []
+    for i in range(len(ghi)):
+        if ghi[i] < 0:
+            reason.append(1)
+            ghi[i] = np.nan
+        elif temp[i] < -80 or temp[i] > 80:
+            reason.append(2)
+            temp[i] = np.nan
+        elif wind[i] < 0:
+            reason.append(3)
+            wind[i] = np.nan
+        elif np.isnan(ghi[i]):
+            reason.append(4)
+        elif np.isnan(temp[i]):
+            reason.append(5)
+        elif np.isnan(wind[i]):
+            reason.append(6)
+        else:
+            reason.append(0)
+    return np.array(reason, dtype=np.int8)
+
+
+def test_classify_matches_row_by_row_rules(app_module):
+    rng = np.random.default_rng(0)
+    columns = [rng.normal(0, 60, 500) for _ in range(3)]
+    for values in columns:
+        values[rng.random(500) < 0.1] = np.nan
+        values[:6] = [-80.0, 80.0, 0.0, -0.0, 80.5, -80.5]
+
+    expected_inputs = [values.copy() for values in columns]
+    actual_inputs = [values.copy() for values in columns]
+    expected = _classify_reference(*expected_inputs)
+    actual = app_module._classify(*actual_inputs)
+
+    np.testing.assert_array_equal(expected, actual)
+    for exp_values, act_values in zip(expected_inputs, actual_inputs):
+        np.testing.assert_array_equal(exp_values, act_values)
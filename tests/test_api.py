@@ -0,0 +1,133 @@
+import datetime as dt
+from contextlib import asynccontextmanager
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as api
+
+TS = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+class FakeCursor:
+    def __init__(self, pool, row_factory=None):
+        self.pool = pool
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=()):
+        self.pool.queries.append(sql)
+        if "DISTINCT site" in sql:
+            self.rows = [(site,) for site in self.pool.sites]
+        elif "weather_summary" in sql:
+            # SUM() over BIGINT comes back from Postgres as NUMERIC -> Decimal
+            self.rows = [
+                {"k": table, "row_count": Decimal(count), "first_ts": TS, "latest_ts": TS}
+                for table, count in (("raw_weather", 3), ("fact_weather", 2))
+                if table in params[0]
+            ]
+        elif "FROM fact_weather" in sql:
+            self.rows = [(params[0], TS, 1.0, 2.0, 3.0)]
+        else:
+            self.rows = [(params[0], TS, 1.0, 2.0, 3.0, TS)]
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def cursor(self, row_factory=None):
+        return FakeCursor(self.pool, row_factory)
+
+    async def execute(self, sql):
+        self.pool.queries.append(sql)
+
+
+class FakePool:
+    sites = ["chicago_il"]
+
+    def __init__(self, *args, **kwargs):
+        self.queries = []
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @asynccontextmanager
+    async def connection(self):
+        yield FakeConnection(self)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://fake")
+    monkeypatch.setenv("SITE_NAME", "chicago_il")
+    monkeypatch.setattr(api, "AsyncConnectionPool", FakePool)
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+def test_bundle_returns_rows_and_metrics(client):
+    response = client.get("/weather/bundle", params={"site": "chicago_il", "hours": 3})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["site"] == "chicago_il" and body["hours"] == 3
+    assert body["raw"]["rows"] == [
+        {
+            "site": "chicago_il",
+            "ts_utc": "2025-01-01T00:00:00+00:00",
+            "ghi_wm2": 1.0,
+            "t2m_c": 2.0,
+            "ws10_mps": 3.0,
+            "ingested_at": "2025-01-01T00:00:00+00:00",
+        }
+    ]
+    assert body["hourly"]["rows"][0].keys() == {"site", "ts_utc", "ghi_wm2", "temp_c", "wind_mps"}
+    assert body["raw"]["summary"]["row_count"] == 3
+    assert body["hourly"]["summary"]["row_count"] == 2
+    assert body["metrics"]["dropped_rows"] == 1
+    assert body["metrics"]["kept_percentage"] == pytest.approx(200 / 3)
+
+
+def test_bundle_rejects_unknown_site(client):
+    response = client.get("/weather/bundle", params={"site": "atlantis"})
+
+    assert response.status_code == 404
+    assert "atlantis" in response.json()["detail"]
+
+
+def test_summary_rollup_returns_integer_counts(client):
+    body = client.get("/weather/metrics").json()
+
+    assert body["raw"] == {"row_count": 3, "first_ts": "2025-01-01T00:00:00+00:00", "latest_ts": "2025-01-01T00:00:00+00:00"}
+    assert isinstance(body["raw"]["row_count"], int) and isinstance(body["fact"]["row_count"], int)
+
+
+def test_sites_cache_skips_query_until_ttl_expires(client, monkeypatch):
+    pool = client.app.state.db_pool
+    now = [1000.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: now[0])
+
+    def site_queries():
+        return sum("DISTINCT site" in sql for sql in pool.queries)
+
+    assert client.get("/weather/sites").json() == {"sites": ["chicago_il"]}
+    now[0] += api.SITES_CACHE_TTL_SECONDS - 1
+    client.get("/weather/sites")
+    assert site_queries() == 1
+
+    now[0] += 2
+    client.get("/weather/sites")
+    assert site_queries() == 2
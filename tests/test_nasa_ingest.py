@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.etl import nasa
+
+
+def _payload() -> dict:
+    hourly = {"20250101": list(range(24))}
+    return {"properties": {"parameter": {param: hourly for param in nasa.PARAMS}}}
+
+
+def _fetch(responses: list[httpx.Response]) -> list:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await nasa._fetch_chunk(client, asyncio.Semaphore(1), 1.0, 2.0, "s", "20250101", "20250101")
+
+    return asyncio.run(run())
+
+
+def test_fetch_chunk_retries_throttling_and_server_errors(monkeypatch):
+    monkeypatch.setattr(nasa, "BACKOFF_FACTOR", 0.0)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+        httpx.Response(200, json=_payload()),
+    ]
+
+    rows = _fetch(responses)
+
+    assert len(rows) == 24 and not responses
+
+
+def test_fetch_chunk_raises_after_exhausting_retries(monkeypatch):
+    monkeypatch.setattr(nasa, "BACKOFF_FACTOR", 0.0)
+    responses = [httpx.Response(500) for _ in range(nasa.MAX_RETRIES + 1)]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _fetch(responses)
+    assert not responses
+
+
+def test_retry_delay_prefers_retry_after_header():
+    assert nasa._retry_delay(httpx.Response(429, headers={"Retry-After": "7"}), attempt=0) == 7.0
+    assert nasa._retry_delay(httpx.Response(503), attempt=2) == nasa.BACKOFF_FACTOR * 4
+    assert nasa._retry_delay(httpx.Response(429, headers={"Retry-After": "7200"}), attempt=0) == nasa.MAX_RETRY_AFTER_SECONDS
+    far_future = "Wed, 01 Jan 2100 00:00:00 GMT"
+    assert nasa._retry_delay(httpx.Response(503, headers={"Retry-After": far_future}), attempt=0) == nasa.MAX_RETRY_AFTER_SECONDS
+
+
+def test_run_ingest_writes_successful_windows_before_raising(monkeypatch):
+    failure = httpx.HTTPStatusError("boom", request=None, response=None)
+    written = []
+
+    async def fake_fetch_windows(lat, lon, site, windows):
+        return [[("s", "row-1")], failure, [("s", "row-3")]]
+
+    monkeypatch.setattr(nasa, "_fetch_windows", fake_fetch_windows)
+    monkeypatch.setattr(nasa, "bulk_upsert_raw_weather", lambda rows: written.extend(rows) or len(rows))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        nasa.run_ingest(1.0, 2.0, "s", "20250101", "20250121", chunk_days=7)
+    assert written == [("s", "row-1"), ("s", "row-3")]
@@ -0,0 +1,85 @@
+import datetime as dt
+import json
+
+from app.etl import nasa
+from app.etl.pgcopy import _copy_buffer, _format_value_for_copy
+
+UTC = dt.timezone.utc
+
+
+def _payload(**params: dict) -> dict:
+    return {"properties": {"parameter": params}}
+
+
+def _hourly(days: list[str], value=1.5) -> dict:
+    return {day: [value] * 24 for day in days}
+
+
+def test_payload_to_rows_matches_dict_path_with_missing_values():
+    ghi = _hourly(["20250101", "20250102"])
+    ghi["20250101"][3] = None
+    t2m = _hourly(["20250101", "20250102"], value=-2.25)
+    ws = _hourly(["20250101", "20250102"], value=4)
+    ws["20250102"][23] = None
+    payload = _payload(ALLSKY_SFC_SW_DWN=ghi, T2M=t2m, WS10M=ws)
+
+    rows = nasa.payload_to_rows("site", payload)
+
+    assert rows == nasa.merge_params_to_rows("site", nasa.parse_power_json(payload))
+    assert len(rows) == 48
+    assert rows[0][1] == dt.datetime(2025, 1, 1, tzinfo=UTC)
+    assert rows[3][2] is None and rows[-1][4] is None
+    assert json.loads(rows[3][5]) == {"source": "NASA_POWER", "ghi_wm2": None, "t2m_c": -2.25, "ws10_mps": 4.0}
+
+
+def test_series_as_array_rejects_gaps_and_partial_days():
+    assert nasa._series_as_array(_hourly(["20250101", "20250103"])) is None
+    assert nasa._series_as_array({"20250101": [1.0] * 23}) is None
+    assert nasa._series_as_array({"2025010100": 1.0}) is None
+
+    start, values = nasa._series_as_array(_hourly(["20250102", "20250101"]))
+    assert start == dt.datetime(2025, 1, 1, tzinfo=UTC) and values.shape == (48,)
+
+
+def test_payload_to_rows_falls_back_for_gapped_series():
+    gapped = _hourly(["20250101", "20250103"])
+    payload = _payload(ALLSKY_SFC_SW_DWN=gapped, T2M=gapped, WS10M=gapped)
+
+    rows = nasa.payload_to_rows("site", payload)
+
+    assert len(rows) == 48
+    assert {row[1].date() for row in rows} == {dt.date(2025, 1, 1), dt.date(2025, 1, 3)}
+
+
+def test_payload_to_rows_aligns_mismatched_grids():
+    payload = _payload(
+        ALLSKY_SFC_SW_DWN=_hourly(["20250101", "20250102"]),
+        T2M=_hourly(["20250101"]),
+        WS10M=_hourly(["20250101", "20250102"]),
+    )
+
+    rows = nasa.payload_to_rows("site", payload)
+
+    assert len(rows) == 48
+    assert all(row[3] is None for row in rows[24:]) and rows[0][3] == 1.5
+
+
+def test_series_from_param_scalar_keys_skip_invalid_entries():
+    series = nasa._series_from_param(
+        {"2025010100": 1.0, "2025010123": None, "2025010124": 5.0, "20250101": 2.0, "abcdefghij": 3.0}
+    )
+
+    assert series == {
+        dt.datetime(2025, 1, 1, 0, tzinfo=UTC): 1.0,
+        dt.datetime(2025, 1, 1, 23, tzinfo=UTC): None,
+    }
+
+
+def test_copy_format_escapes_text_and_nulls():
+    assert _format_value_for_copy(None) == "\\N"
+    assert _format_value_for_copy("a\tb\\c\nd\re") == "a\\tb\\\\c\\nd\\re"
+    assert _format_value_for_copy(0.1) == "0.1"
+    assert _format_value_for_copy(dt.datetime(2025, 1, 1, tzinfo=UTC)) == "2025-01-01T00:00:00+00:00"
+
+    buffer = _copy_buffer([("s\t1", None, 2.5), ("s", 1, "x")])
+    assert buffer.read() == "s\\t1\t\\N\t2.5\ns\t1\tx\n"
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.transform import _silver_kernels
+from app.transform.silver_clean import clean_to_hourly
+
+
+def test_keep_mask_variants_agree_on_bounds_and_missing_values():
+    ghi = np.array([0.0, -0.0, -1e-9, np.nan, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0])
+    t2m = np.array([0.0, 0.0, 0.0, 0.0, -80.0, 80.0, 80.000001, -80.5, np.nan, 0.0])
+    ws = np.array([0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, np.nan])
+    expected = [True, True, False, False, True, True, False, False, False, False]
+
+    np.testing.assert_array_equal(_silver_kernels._keep_mask_numpy(ghi, t2m, ws), expected)
+    np.testing.assert_array_equal(_silver_kernels.keep_mask(ghi, t2m, ws), expected)
+
+
+def test_compiled_keep_mask_matches_numpy_on_random_values():
+    numba = pytest.importorskip("numba")
+    rng = np.random.default_rng(1)
+    ghi, t2m, ws = (rng.normal(0, 60, 1000) for _ in range(3))
+    for values in (ghi, t2m, ws):
+        values[rng.random(1000) < 0.1] = np.nan
+
+    compiled = numba.njit(_silver_kernels._keep_mask_loop)
+    np.testing.assert_array_equal(compiled(ghi, t2m, ws), _silver_kernels._keep_mask_numpy(ghi, t2m, ws))
+
+
+def test_clean_to_hourly_keeps_latest_ingest_per_hour():
+    raw = pd.DataFrame(
+        {
+            "site": ["b", "a", "a", "a", "a", "a"],
+            "ts_utc": [
+                "2025-01-01T00:00:00+00:00",
+                "2025-01-01T01:10:00+00:00",
+                "2025-01-01T01:50:00+00:00",
+                "2025-01-01T01:20:00+00:00",
+                "2025-01-01T00:30:00+00:00",
+                "2025-01-01T02:00:00+00:00",
+            ],
+            "ghi_wm2": [1.0, 10.0, 11.0, 12.0, 5.0, -1.0],
+            "t2m_c": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            "ws10_mps": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+            "ingested_at": [
+                "2025-01-02T00:00:00+00:00",
+                "2025-01-02T00:00:00+00:00",
+                "2025-01-03T00:00:00+00:00",
+                "2025-01-03T00:00:00+00:00",
+                "2025-01-02T00:00:00+00:00",
+                "2025-01-02T00:00:00+00:00",
+            ],
+        }
+    )
+
+    cleaned = clean_to_hourly(raw)
+
+    assert list(cleaned.columns) == ["site", "ts_utc", "ghi_wm2", "temp_c", "wind_mps"]
+    assert list(zip(cleaned["site"], cleaned["ts_utc"].dt.hour, cleaned["ghi_wm2"])) == [
+        ("a", 0, 5.0),
+        # 01:50 and 01:20 tie on the latest ingest; the later row wins, as with keep="last"
+        ("a", 1, 12.0),
+        ("b", 0, 1.0),
+    ]
+    assert str(cleaned["ts_utc"].dt.tz) == "UTC"